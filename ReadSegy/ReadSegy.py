@@ -1,11 +1,17 @@
+import os
+import sys
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import segyio
 import numpy as np
 import hashlib
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
+# This script runs from ReadSegy/, thumbnail_cache lives in the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from thumbnail_cache import DEFAULT_CACHE_DIR, build_thumbnails, clip_for_display
+
 def open_segy():
     file_path = filedialog.askopenfilename(filetypes=[("SEGY files", "*.sgy;*.segy"), ("All files", "*.*")])
     if not file_path:
@@ -38,8 +44,8 @@ def open_segy():
             # Update text areas
             update_text_widgets(textual_header_formatted, f)
             
-            # Display SEGY data as an image
-            plot_segy_image(f)
+            # Display the cached quicklook images, full rendering is on demand
+            show_thumbnails(file_path, f)
     except Exception as e:
         messagebox.showerror("Error", f"Failed to read SEGY file: {e}")
 
@@ -71,16 +77,46 @@ def update_text_widgets(textual_header, f):
         for key, value in f.header[i].items():
             trace_text.insert(tk.END, f"  {key}: {value}\n")
 
+def clear_plot_frame():
+    for widget in frame_plot.winfo_children():
+        widget.destroy()
+
+def show_thumbnails(file_path, f):
+    clear_plot_frame()
+    try:
+        paths = build_thumbnails(file_path, DEFAULT_CACHE_DIR, f=f)
+        preview_images[:] = [tk.PhotoImage(file=paths["vd"]), tk.PhotoImage(file=paths["wiggle"])]
+    except Exception as e:
+        # A broken preview must not stop the metadata from loading
+        preview_images.clear()
+        tk.Label(frame_plot, text=f"Preview unavailable: {e}").pack()
+        return
+
+    for image in preview_images:
+        tk.Label(frame_plot, image=image).pack(side=tk.LEFT, padx=10)
+
+def full_render():
+    file_path = filename_var.get()
+    if not file_path:
+        messagebox.showerror("Error", "Please open a SEGY file first.")
+        return
+
+    try:
+        with segyio.open(file_path, "r", ignore_geometry=True) as f:
+            plot_segy_image(f)
+    except Exception as e:
+        messagebox.showerror("Error", f"Failed to render SEGY file: {e}")
+
 def plot_segy_image(f):
-    data = np.stack([f.trace[i] for i in range(f.tracecount)], axis=1)
-    fig, ax = plt.subplots(figsize=(8, 5))
-    ax.imshow(data, cmap="seismic", aspect="auto", interpolation="none")
+    data, clip = clip_for_display(f.trace.raw[:].T)
+    fig = Figure(figsize=(8, 5))
+    ax = fig.add_subplot()
+    ax.imshow(data, cmap="seismic", aspect="auto", interpolation="none", vmin=-clip, vmax=clip)
     ax.set_title("SEGY Data Visualization")
     ax.set_xlabel("Trace Number")
     ax.set_ylabel("Sample Index")
     
-    for widget in frame_plot.winfo_children():
-        widget.destroy()
+    clear_plot_frame()
     
     canvas = FigureCanvasTkAgg(fig, master=frame_plot)
     canvas.draw()
@@ -135,9 +171,11 @@ trace_text.pack()
 
 frame_plot = tk.Frame(root)
 frame_plot.pack(pady=10)
+preview_images = []  # Keep PhotoImage references alive
 
 bottom_frame = tk.Frame(root)
 bottom_frame.pack(side=tk.BOTTOM, fill=tk.X)
 
 tk.Button(bottom_frame, text="Quit", command=root.quit).pack(side=tk.RIGHT, padx=10, pady=5)
+tk.Button(bottom_frame, text="Full Render", command=full_render).pack(side=tk.RIGHT, padx=10, pady=5)
 root.mainloop()
@@ -4,15 +4,16 @@ import pandas as pd
 import numpy as np
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
-from tkinter import filedialog, messagebox
-import matplotlib.pyplot as plt
+from tkinter import filedialog, messagebox, PhotoImage
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from thumbnail_cache import DEFAULT_CACHE_DIR, WIGGLE_TRACES, build_thumbnails
 
 class SegyReaderApp(ttk.Window):
     def __init__(self):
         super().__init__(themename="darkly")  
         self.title("📂 SEG-Y File Reader")
-        self.geometry("900x650")
+        self.geometry("900x800")
 
         # Header Label
         ttk.Label(self, text="SEG-Y File Reader", font=("Helvetica", 18, "bold")).pack(pady=10)
@@ -46,9 +47,19 @@ class SegyReaderApp(ttk.Window):
 
         self.tree.pack(fill="both", expand=True)
 
-        # Trace Visualization Button
+        # Quicklook Preview (cached thumbnails)
+        self.preview_frame = ttk.LabelFrame(self, text="🖼️ Quicklook Preview")
+        self.preview_frame.pack(fill="x", padx=10, pady=5)
+        self.vd_preview = ttk.Label(self.preview_frame)
+        self.vd_preview.pack(side="left", padx=10, pady=5)
+        self.wiggle_preview = ttk.Label(self.preview_frame)
+        self.wiggle_preview.pack(side="left", padx=10, pady=5)
+        self.preview_images = []
+
+        # Trace Visualization Button (full rendering on demand)
         self.plot_button = ttk.Button(self, text="📊 Plot Trace Data", command=self.plot_traces, bootstyle=INFO)
         self.plot_button.pack(pady=5)
+        self.plot_window = None
 
         # Status Label
         self.status_label = ttk.Label(self, text="", font=("Arial", 12, "bold"))
@@ -112,37 +123,66 @@ class SegyReaderApp(ttk.Window):
                 self.progress["value"] = 75
 
                 self.segy_file = segy_file  # Store for plotting traces
-                self.traces = f.trace.raw[:]  # Store trace data
+
+                # Cached thumbnails make the preview instant, traces are only decoded on a cache miss
+                preview_error = self.show_preview(segy_file, f)
 
                 self.progress["value"] = 100
-                self.log_message("✅ SEG-Y file loaded successfully!")
+                if preview_error is None:
+                    self.log_message("✅ SEG-Y file loaded successfully!")
+                else:
+                    self.log_message(f"⚠️ SEG-Y file loaded, but the preview is unavailable: {preview_error}")
 
         except Exception as e:
             messagebox.showerror("Error", f"❌ Failed to load SEG-Y file:\n{str(e)}")
             self.log_message("❌ Failed to load SEG-Y file!")
 
+    def show_preview(self, segy_file, f):
+        """Show the cached variable-density and wiggle thumbnails, returning the error message if they fail."""
+        try:
+            paths = build_thumbnails(segy_file, DEFAULT_CACHE_DIR, f=f)
+            self.preview_images = [PhotoImage(file=paths["vd"]), PhotoImage(file=paths["wiggle"])]
+        except Exception as e:
+            # A broken preview must not stop the metadata from loading
+            self.preview_images = []
+            self.vd_preview.config(image="")
+            self.wiggle_preview.config(image="")
+            return str(e)
+
+        self.vd_preview.config(image=self.preview_images[0])
+        self.wiggle_preview.config(image=self.preview_images[1])
+        return None
+
     def plot_traces(self):
         """Plot first 5 traces from the loaded SEG-Y file."""
-        if not hasattr(self, "traces"):
+        if not hasattr(self, "segy_file"):
             messagebox.showerror("Error", "⚠️ Please load a SEG-Y file first.")
             return
 
         try:
-            fig, ax = plt.subplots(figsize=(6, 4))
-            for i in range(min(5, len(self.traces))):  # Plot only first 5 traces
-                ax.plot(self.traces[i], label=f"Trace {i+1}")
+            with segyio.open(self.segy_file, "r", ignore_geometry=True) as f:
+                traces = [f.trace[i] for i in range(min(WIGGLE_TRACES, f.tracecount))]  # Plot only first 5 traces
+
+            # Reuse one plot window and figure instead of creating new ones on every click
+            if self.plot_window is None or not self.plot_window.winfo_exists():
+                self.plot_window = ttk.Toplevel(self)
+                self.plot_window.title("📊 Trace Plot")
+                self.plot_figure = Figure(figsize=(6, 4))
+                self.plot_canvas = FigureCanvasTkAgg(self.plot_figure, master=self.plot_window)
+                self.plot_canvas.get_tk_widget().pack(fill="both", expand=True)
+
+            self.plot_figure.clear()
+            ax = self.plot_figure.add_subplot()
+            for i, trace in enumerate(traces):
+                ax.plot(trace, label=f"Trace {i+1}")
 
             ax.set_title("SEG-Y Trace Data")
             ax.set_xlabel("Sample Index")
             ax.set_ylabel("Amplitude")
             ax.legend()
 
-            # Embed Matplotlib Figure into GUI
-            top = ttk.Toplevel(self)
-            top.title("📊 Trace Plot")
-            canvas = FigureCanvasTkAgg(fig, master=top)
-            canvas.draw()
-            canvas.get_tk_widget().pack(fill="both", expand=True)
+            self.plot_canvas.draw()
+            self.plot_window.lift()
 
         except Exception as e:
             messagebox.showerror("Error", f"❌ Failed to plot traces:\n{str(e)}")
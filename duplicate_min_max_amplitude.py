@@ -1,16 +1,64 @@
 import os
+import hashlib
+import numpy as np
+import pandas as pd
+import segyio
 from copy_rename_duplicates import (
     get_user_input, create_destination_folder, count_files_with_extension,
     copy_files, write_log, create_repeated_folder
 )
+from thumbnail_cache import DEFAULT_CACHE_DIR, cached_file_key, build_thumbnails
 
-def process_segy_files(folder_path):
-    """Function to process SEG-Y files and extract relevant details"""
+def process_segy_files(folder_path, cache_dir=DEFAULT_CACHE_DIR):
+    """Function to process SEG-Y files and extract relevant details.
+
+    Also renders each file's quicklook thumbnails into the shared thumbnail cache.
+    """
     print(f"📂 Processing SEG-Y files in: {folder_path}")
 
-    # Dummy return value (replace with actual processing logic)
-    # If using pandas, return a DataFrame instead of None
-    return None  # Or return a pandas DataFrame
+    rows = []
+    seen_keys = set()
+    for root, _, files in os.walk(folder_path):
+        for file in sorted(files):
+            if not file.lower().endswith((".sgy", ".segy")):
+                continue
+
+            file_path = os.path.join(root, file)
+            try:
+                key = cached_file_key(file_path, cache_dir)
+                with segyio.open(file_path, "r", ignore_geometry=True) as f:
+                    min_amp, max_amp = np.inf, -np.inf
+                    for trace in f.trace:
+                        min_amp, max_amp = min(min_amp, trace.min()), max(max_amp, trace.max())
+
+                    header_hash = hashlib.sha256(f.text[0]).hexdigest()
+
+                    # A thumbnail failure must not drop the file from the results
+                    try:
+                        build_thumbnails(file_path, cache_dir, f=f, key=key)
+                        thumbnail_key = key
+                    except Exception as e:
+                        print(f"⚠️ No thumbnail for {file}: {str(e)}")
+                        thumbnail_key = ""
+            except Exception as e:
+                print(f"⚠️ Skipping {file}: {str(e)}")
+                continue
+
+            rows.append({
+                "Filename": file,
+                "Min Amplitude": float(min_amp),
+                "Max Amplitude": float(max_amp),
+                "File Size": os.path.getsize(file_path),
+                "Textual Header Hash": header_hash,
+                "Duplicate": key in seen_keys,
+                "File Path": file_path,
+                "Thumbnail Key": thumbnail_key,
+            })
+            seen_keys.add(key)
+
+    if not rows:
+        return None
+    return pd.DataFrame(rows)
 
 def main():
     try:
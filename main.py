@@ -3,18 +3,21 @@ import pandas as pd
 import segyio
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
-from tkinter import filedialog, messagebox, StringVar
+from tkinter import filedialog, messagebox, StringVar, PhotoImage
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from copy_rename_duplicates import (
     create_destination_folder, count_files_with_extension, copy_files, 
     write_log, create_repeated_folder
 )
 from duplicate_min_max_amplitude import process_segy_files
+from thumbnail_cache import DEFAULT_CACHE_DIR, thumbnail_paths, lookup_thumbnails, build_thumbnails, clip_for_display
 
 class FileProcessorApp(ttk.Window):
     def __init__(self):
         super().__init__(themename="darkly")  
         self.title("📂 File Processing Tool")
-        self.geometry("750x650")
+        self.geometry("900x850")
 
         # Header Label
         ttk.Label(self, text="File Processing Tool", font=("Helvetica", 18, "bold")).pack(pady=15)
@@ -60,14 +63,36 @@ class FileProcessorApp(ttk.Window):
         self.results_frame = ttk.LabelFrame(self, text="📊 Processed Results")
         self.results_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
-        columns = ("Filename", "Min Amplitude", "Max Amplitude", "File Size", "Textual Header Hash", "Duplicate")
-        self.results_table = ttk.Treeview(self.results_frame, columns=columns, show="headings", height=8)
+        # Thumbnails can only be drawn in the tree column (#0), so it is shown alongside the headings
+        self.result_columns = ("Filename", "Min Amplitude", "Max Amplitude", "File Size", "Textual Header Hash", "Duplicate")
+        ttk.Style().configure("Results.Treeview", rowheight=52)
+        self.results_table = ttk.Treeview(self.results_frame, columns=self.result_columns, show="tree headings",
+                                          height=6, style="Results.Treeview")
 
-        for col in columns:
+        self.results_table.heading("#0", text="Thumbnail")
+        self.results_table.column("#0", width=80, stretch=False)
+        for col in self.result_columns:
             self.results_table.heading(col, text=col)
             self.results_table.column(col, width=120)
 
         self.results_table.pack(fill="both", expand=True)
+        self.results_table.bind("<<TreeviewSelect>>", self.show_preview)
+
+        # Keep PhotoImage references alive, Tk does not hold them itself
+        self.thumbnail_images = {}
+        self.row_files = {}
+
+        # Quicklook Preview
+        self.preview_frame = ttk.LabelFrame(self, text="🖼️ Quicklook Preview")
+        self.preview_frame.pack(fill="x", padx=10, pady=5)
+        self.vd_preview = ttk.Label(self.preview_frame)
+        self.vd_preview.pack(side="left", padx=10, pady=5)
+        self.wiggle_preview = ttk.Label(self.preview_frame)
+        self.wiggle_preview.pack(side="left", padx=10, pady=5)
+        self.full_render_button = ttk.Button(self.preview_frame, text="📊 Full Render", command=self.full_render, bootstyle=INFO)
+        self.full_render_button.pack(side="right", padx=10, pady=5)
+        self.preview_images = []
+        self.render_window = None
 
         # Refresh Button
         self.refresh_button = ttk.Button(self, text="🔄 Refresh Results", command=self.load_results, bootstyle=PRIMARY)
@@ -152,12 +177,98 @@ class FileProcessorApp(ttk.Window):
         for row in self.results_table.get_children():
             self.results_table.delete(row)
 
+        self.thumbnail_images.clear()
+        self.row_files.clear()
+
         # Insert new data
         for _, row in df.iterrows():
-            self.results_table.insert("", "end", values=tuple(row))
+            values = tuple(row.get(col, "") for col in self.result_columns)
+            file_path, key = row.get("File Path"), row.get("Thumbnail Key")
+            image = self.load_table_thumbnail(key) if isinstance(key, str) else None
+
+            item = self.results_table.insert("", "end", values=values, image=image or "")
+            if isinstance(file_path, str):
+                self.row_files[item] = (file_path, key if isinstance(key, str) else None)
+            if image is not None:
+                self.thumbnail_images[item] = image
 
         self.log_message("📊 Results loaded successfully!")
 
+    def load_table_thumbnail(self, key):
+        """Load a half-size variable-density thumbnail for the results table."""
+        vd_path = thumbnail_paths(key, DEFAULT_CACHE_DIR)["vd"]
+        if not os.path.exists(vd_path):
+            return None
+        try:
+            return PhotoImage(file=vd_path).subsample(2)
+        except Exception as e:
+            self.log_message(f"⚠️ Unreadable thumbnail {os.path.basename(vd_path)}: {str(e)}")
+            return None
+
+    def selected_file(self):
+        """Return (file path, thumbnail key) of the selected result row, or None."""
+        selection = self.results_table.selection()
+        if not selection:
+            return None
+        return self.row_files.get(selection[0])
+
+    def show_preview(self, event=None):
+        """Show the cached quicklook thumbnails of the selected file."""
+        selected = self.selected_file()
+        if selected is None:
+            return
+
+        file_path, key = selected
+        try:
+            # Thumbnails may have been evicted since the scan, re-render them if so
+            paths = lookup_thumbnails(file_path, DEFAULT_CACHE_DIR, key)
+            if paths is None:
+                self.log_message(f"🖼️ Rendering thumbnails for {os.path.basename(file_path)}...")
+                paths = build_thumbnails(file_path, DEFAULT_CACHE_DIR)
+            self.preview_images = [PhotoImage(file=paths["vd"]), PhotoImage(file=paths["wiggle"])]
+        except Exception as e:
+            self.log_message(f"⚠️ Preview unavailable: {str(e)}")
+            self.preview_images = []
+            self.vd_preview.config(image="")
+            self.wiggle_preview.config(image="")
+            return
+
+        self.vd_preview.config(image=self.preview_images[0])
+        self.wiggle_preview.config(image=self.preview_images[1])
+
+    def full_render(self):
+        """Render the selected file at full resolution, reusing a single plot window."""
+        selected = self.selected_file()
+        if selected is None:
+            messagebox.showerror("Error", "⚠️ Please select a file in the results table.")
+            return
+
+        file_path = selected[0]
+        try:
+            with segyio.open(file_path, "r", ignore_geometry=True) as f:
+                data = f.trace.raw[:].T
+
+            if self.render_window is None or not self.render_window.winfo_exists():
+                self.render_window = ttk.Toplevel(self)
+                self.render_figure = Figure(figsize=(8, 5))
+                self.render_canvas = FigureCanvasTkAgg(self.render_figure, master=self.render_window)
+                self.render_canvas.get_tk_widget().pack(fill="both", expand=True)
+
+            data, clip = clip_for_display(data)
+            self.render_figure.clear()
+            ax = self.render_figure.add_subplot()
+            ax.imshow(data, cmap="seismic", aspect="auto", interpolation="none", vmin=-clip, vmax=clip)
+            ax.set_title(os.path.basename(file_path))
+            ax.set_xlabel("Trace Number")
+            ax.set_ylabel("Sample Index")
+
+            self.render_window.title(f"📊 {os.path.basename(file_path)}")
+            self.render_canvas.draw()
+            self.render_window.lift()
+
+        except Exception as e:
+            messagebox.showerror("Error", f"❌ Failed to render file:\n{str(e)}")
+
 def process_segy_files_in_repeated_folder(destination_path):
     """Process SEG-Y files in the repeated folder and save results in an Excel file."""
     repeated_folder_path = create_repeated_folder(destination_path)
@@ -0,0 +1,48 @@
+import os
+import shutil
+import pytest
+
+pytest.importorskip("segyio")
+pytest.importorskip("matplotlib")
+
+from duplicate_min_max_amplitude import process_segy_files
+
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Source_Segy")
+SMALL_SEGY = os.path.join(SOURCE_DIR, "small.sgy")
+
+def test_process_segy_files_flags_only_identical_content_as_duplicate(tmp_path):
+    scan_dir = tmp_path / "scan"
+    scan_dir.mkdir()
+    shutil.copy(SMALL_SEGY, scan_dir / "a.sgy")
+    shutil.copy(SMALL_SEGY, scan_dir / "b.sgy")
+
+    # Same size and headers as a.sgy, only the last sample of the last trace differs
+    changed = bytearray((scan_dir / "a.sgy").read_bytes())
+    changed[-4:] = b"\x42\x64\x00\x00"  # IBM float 100.0
+    (scan_dir / "c.sgy").write_bytes(bytes(changed))
+
+    df = process_segy_files(str(scan_dir), cache_dir=str(tmp_path / "cache"))
+
+    assert list(df["Filename"]) == ["a.sgy", "b.sgy", "c.sgy"]
+    assert list(df["Duplicate"]) == [False, True, False]
+    assert df["Thumbnail Key"][0] == df["Thumbnail Key"][1] != df["Thumbnail Key"][2]
+    assert df["Max Amplitude"][2] == 100.0
+    assert df["Max Amplitude"][0] != df["Max Amplitude"][2]
+
+def test_process_segy_files_without_segy_files_returns_none(tmp_path):
+    (tmp_path / "notes.txt").write_text("not seismic")
+    assert process_segy_files(str(tmp_path), cache_dir=str(tmp_path / "cache")) is None
+
+def test_process_segy_files_keeps_rows_when_thumbnails_fail(tmp_path):
+    scan_dir = tmp_path / "scan"
+    scan_dir.mkdir()
+    shutil.copy(SMALL_SEGY, scan_dir / "a.sgy")
+
+    # A cache dir below a regular file can never be created
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    df = process_segy_files(str(scan_dir), cache_dir=str(blocker / "cache"))
+
+    assert list(df["Filename"]) == ["a.sgy"]
+    assert list(df["Thumbnail Key"]) == [""]
+    assert df["Max Amplitude"][0] > df["Min Amplitude"][0]
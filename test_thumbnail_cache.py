@@ -0,0 +1,91 @@
+import os
+import shutil
+import pytest
+import thumbnail_cache
+
+pytest.importorskip("segyio")
+pytest.importorskip("matplotlib")
+
+from thumbnail_cache import file_cache_key, cached_file_key, thumbnail_paths, build_thumbnails, evict_thumbnails
+
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Source_Segy")
+SMALL_SEGY = os.path.join(SOURCE_DIR, "small.sgy")
+
+def write_entry(cache_dir, key, vd_mtime, wiggle_mtime, size=100):
+    """Write a fake thumbnail pair with the given modification times."""
+    paths = thumbnail_paths(key, str(cache_dir))
+    for name, mtime in (("vd", vd_mtime), ("wiggle", wiggle_mtime)):
+        with open(paths[name], "wb") as fh:
+            fh.write(b"\0" * size)
+        os.utime(paths[name], (mtime, mtime))
+    return paths
+
+def test_file_cache_key_identical_files_share_key(tmp_path):
+    copy_path = tmp_path / "copy.sgy"
+    shutil.copy(SMALL_SEGY, copy_path)
+    assert file_cache_key(SMALL_SEGY) == file_cache_key(str(copy_path))
+
+def test_file_cache_key_detects_change_deep_in_large_file(tmp_path):
+    original = tmp_path / "a.sgy"
+    changed = tmp_path / "b.sgy"
+    data = bytearray(os.urandom(13 * 1024 ** 2))
+    original.write_bytes(bytes(data))
+    data[7 * 1024 ** 2 + 123] ^= 0xFF
+    changed.write_bytes(bytes(data))
+    assert file_cache_key(str(original)) != file_cache_key(str(changed))
+
+def test_cached_file_key_skips_rehash_until_file_changes(tmp_path, monkeypatch):
+    segy_path = tmp_path / "a.sgy"
+    shutil.copy(SMALL_SEGY, segy_path)
+    cache_dir = str(tmp_path / "cache")
+    key = cached_file_key(str(segy_path), cache_dir)
+    assert key == file_cache_key(str(segy_path))
+
+    def fail_hash(file_path):
+        raise AssertionError("file was rehashed")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(thumbnail_cache, "file_cache_key", fail_hash)
+        assert cached_file_key(str(segy_path), cache_dir) == key
+
+    data = bytearray(segy_path.read_bytes())
+    data[-1] ^= 0xFF
+    segy_path.write_bytes(bytes(data))
+    stat = os.stat(segy_path)
+    os.utime(segy_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert cached_file_key(str(segy_path), cache_dir) != key
+
+def test_evict_thumbnails_removes_least_recently_used_pairs(tmp_path):
+    # "aaa" has an old vd PNG, but its wiggle PNG was used after all of "bbb"
+    aaa = write_entry(tmp_path, "aaa", 100, 300)
+    bbb = write_entry(tmp_path, "bbb", 200, 200)
+    ccc = write_entry(tmp_path, "ccc", 400, 400)
+
+    assert evict_thumbnails(str(tmp_path), max_bytes=400) == 1
+    assert not os.path.exists(bbb["vd"]) and not os.path.exists(bbb["wiggle"])
+    for paths in (aaa, ccc):
+        assert os.path.exists(paths["vd"]) and os.path.exists(paths["wiggle"])
+
+def test_evict_thumbnails_spares_kept_key(tmp_path):
+    old = write_entry(tmp_path, "old", 100, 100)
+    new = write_entry(tmp_path, "new", 200, 200)
+
+    evict_thumbnails(str(tmp_path), max_bytes=0, keep="old")
+    assert os.path.exists(old["vd"]) and os.path.exists(old["wiggle"])
+    assert not os.path.exists(new["vd"]) and not os.path.exists(new["wiggle"])
+
+def test_build_thumbnails_renders_then_hits_cache(tmp_path, monkeypatch):
+    paths = build_thumbnails(SMALL_SEGY, str(tmp_path))
+    assert os.path.getsize(paths["vd"]) > 0 and os.path.getsize(paths["wiggle"]) > 0
+    assert [name for name in os.listdir(tmp_path) if name.endswith(".tmp")] == []
+
+    def fail_render(f, output_path):
+        raise AssertionError("thumbnail was rendered again")
+
+    monkeypatch.setattr(thumbnail_cache, "render_variable_density", fail_render)
+    monkeypatch.setattr(thumbnail_cache, "render_wiggle", fail_render)
+    assert build_thumbnails(SMALL_SEGY, str(tmp_path)) == paths
+
+    # A hit by key alone must not even open the file
+    missing_path = str(tmp_path / "missing.sgy")
+    assert build_thumbnails(missing_path, str(tmp_path), key=paths["key"]) == paths
@@ -0,0 +1,209 @@
+import os
+import json
+import hashlib
+import tempfile
+import numpy as np
+import segyio
+from matplotlib.figure import Figure
+
+# Thumbnails are shared by every tool, keyed by file content rather than path
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".segy_thumbnails")
+DEFAULT_MAX_CACHE_BYTES = 50 * 1024 ** 2  # 50 MB
+
+VD_MAX_TRACES = 256
+VD_MAX_SAMPLES = 256
+VD_SIZE = (128, 96)  # Pixels
+WIGGLE_TRACES = 5
+WIGGLE_SIZE = (240, 160)  # Pixels
+THUMBNAIL_DPI = 100
+
+HASH_CHUNK = 1024 ** 2  # 1 MB
+KEY_INDEX_NAME = "key_index.json"  # Maps file path, size and mtime to the content key
+
+def file_cache_key(file_path):
+    """Function to compute a content key for a file.
+
+    The key is a SHA-256 of the whole file, so renamed or copied files share
+    thumbnails and an edited file never gets a stale preview.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _write_atomic(output_path, write):
+    """Function to write output_path through a temp file in the same folder and move it into place.
+
+    An interrupted write then never leaves a truncated file in the cache.
+    """
+    fd, temp_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(output_path))
+    os.close(fd)
+    try:
+        write(temp_path)
+        os.replace(temp_path, output_path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+def cached_file_key(file_path, cache_dir=DEFAULT_CACHE_DIR):
+    """Function to get a file's content key, only rehashing when its size or mtime changed.
+
+    The key index is just a shortcut, so failing to read or write it falls
+    back to hashing the file.
+    """
+    stat = os.stat(file_path)
+    path = os.path.abspath(file_path)
+    index_path = os.path.join(cache_dir, KEY_INDEX_NAME)
+
+    try:
+        with open(index_path, "r", encoding="utf-8") as fh:
+            index = json.load(fh)
+    except (OSError, ValueError):
+        index = {}
+
+    entry = index.get(path)
+    if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+        return entry["key"]
+
+    key = file_cache_key(file_path)
+    index[path] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "key": key}
+
+    def write_index(temp_path):
+        with open(temp_path, "w", encoding="utf-8") as fh:
+            json.dump(index, fh)
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        _write_atomic(index_path, write_index)
+    except OSError:
+        pass
+    return key
+
+def thumbnail_paths(key, cache_dir=DEFAULT_CACHE_DIR):
+    """Function to get the variable-density and wiggle PNG paths for a cache key"""
+    return {
+        "key": key,
+        "vd": os.path.join(cache_dir, f"{key}_vd.png"),
+        "wiggle": os.path.join(cache_dir, f"{key}_wiggle.png"),
+    }
+
+def lookup_thumbnails(file_path, cache_dir=DEFAULT_CACHE_DIR, key=None):
+    """Function to return cached thumbnail paths for a file, or None on a cache miss"""
+    paths = thumbnail_paths(key or cached_file_key(file_path, cache_dir), cache_dir)
+    if not (os.path.exists(paths["vd"]) and os.path.exists(paths["wiggle"])):
+        return None
+
+    # Refresh modification time so eviction drops the least recently used files first
+    for name in ("vd", "wiggle"):
+        os.utime(paths[name])
+    return paths
+
+def clip_value(data):
+    """Function to get a symmetric display clip from the 99th percentile of the finite amplitudes"""
+    finite = np.abs(data[np.isfinite(data)]).astype(np.float64)
+    clip = float(np.percentile(finite, 99)) if finite.size else 0.0
+    return clip if clip > 0 else 1.0
+
+def clip_for_display(data):
+    """Function to clip data to its display range, replacing non-finite samples.
+
+    Returns the clipped float64 data and the clip, so colormaps never see
+    values that overflow their normalisation.
+    """
+    clip = clip_value(data)
+    # Mask before any cast, signalling NaNs in some sample files warn when converted
+    data = np.where(np.isfinite(data), data, 0).astype(np.float64)
+    return np.clip(data, -clip, clip), clip
+
+def _save_figure(fig, output_path, **kwargs):
+    """Function to save a figure as a PNG without leaving a truncated file behind"""
+    _write_atomic(output_path, lambda temp_path: fig.savefig(temp_path, format="png", dpi=THUMBNAIL_DPI, **kwargs))
+
+def render_variable_density(f, output_path):
+    """Function to save a decimated variable-density PNG of a whole SEG-Y file"""
+    trace_indices = np.unique(np.linspace(0, f.tracecount - 1, min(VD_MAX_TRACES, f.tracecount), dtype=int))
+    sample_step = max(1, -(-len(f.samples) // VD_MAX_SAMPLES))
+    data = np.stack([f.trace[int(i)][::sample_step] for i in trace_indices], axis=1)
+
+    data, clip = clip_for_display(data)
+    fig = Figure(figsize=(VD_SIZE[0] / THUMBNAIL_DPI, VD_SIZE[1] / THUMBNAIL_DPI), dpi=THUMBNAIL_DPI)
+    ax = fig.add_axes([0, 0, 1, 1])
+    ax.imshow(data, cmap="seismic", aspect="auto", interpolation="bilinear", vmin=-clip, vmax=clip)
+    ax.axis("off")
+    _save_figure(fig, output_path)
+
+def render_wiggle(f, output_path):
+    """Function to save a wiggle PNG of the first few traces of a SEG-Y file"""
+    traces, clip = clip_for_display(np.stack([f.trace[i] for i in range(min(WIGGLE_TRACES, f.tracecount))]))
+    scale = 0.5 / clip
+    samples = np.arange(traces.shape[1])
+
+    fig = Figure(figsize=(WIGGLE_SIZE[0] / THUMBNAIL_DPI, WIGGLE_SIZE[1] / THUMBNAIL_DPI), dpi=THUMBNAIL_DPI)
+    ax = fig.add_axes([0, 0, 1, 1])
+    for i, trace in enumerate(traces):
+        offset_trace = i + np.clip(trace * scale, -0.5, 0.5)
+        ax.plot(offset_trace, samples, color="black", linewidth=0.5)
+        ax.fill_betweenx(samples, i, offset_trace, where=offset_trace > i, color="black", linewidth=0)
+    ax.set_xlim(-0.6, len(traces) - 0.4)
+    ax.invert_yaxis()
+    ax.axis("off")
+    _save_figure(fig, output_path, facecolor="white")
+
+def build_thumbnails(file_path, cache_dir=DEFAULT_CACHE_DIR, f=None, key=None, max_bytes=DEFAULT_MAX_CACHE_BYTES):
+    """Function to return thumbnail paths for a SEG-Y file, rendering them on a cache miss.
+
+    Pass an already opened segyio file as ``f`` to avoid reopening it. After a
+    new entry is written the cache is trimmed back to max_bytes.
+    """
+    key = key or cached_file_key(file_path, cache_dir)
+    paths = lookup_thumbnails(file_path, cache_dir, key)
+    if paths is not None:
+        return paths
+
+    os.makedirs(cache_dir, exist_ok=True)
+    paths = thumbnail_paths(key, cache_dir)
+
+    if f is None:
+        with segyio.open(file_path, "r", ignore_geometry=True) as segy:
+            render_variable_density(segy, paths["vd"])
+            render_wiggle(segy, paths["wiggle"])
+    else:
+        render_variable_density(f, paths["vd"])
+        render_wiggle(f, paths["wiggle"])
+
+    evict_thumbnails(cache_dir, max_bytes, keep=key)
+    return paths
+
+def evict_thumbnails(cache_dir=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_CACHE_BYTES, keep=None):
+    """Function to delete the least recently used thumbnails until the cache fits in max_bytes.
+
+    The thumbnails of the ``keep`` key are never deleted.
+    """
+    if not os.path.isdir(cache_dir):
+        return 0
+
+    # Group files by key so a file's thumbnails are always evicted together
+    entries = {}
+    for name in os.listdir(cache_dir):
+        if not name.endswith(".png"):
+            continue
+        path = os.path.join(cache_dir, name)
+        key = name.rsplit("_", 1)[0]
+        stat = os.stat(path)
+        size, last_used, paths = entries.get(key, (0, 0.0, []))
+        entries[key] = (size + stat.st_size, max(last_used, stat.st_mtime), paths + [path])
+
+    total_bytes = sum(size for size, _, _ in entries.values())
+    evicted = 0
+    for key, (size, _, paths) in sorted(entries.items(), key=lambda entry: entry[1][1]):
+        if total_bytes <= max_bytes:
+            break
+        if key == keep:
+            continue
+        for path in paths:
+            os.remove(path)
+        total_bytes -= size
+        evicted += 1
+
+    return evicted